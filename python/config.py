@@ -6,99 +6,120 @@ loading them from environment variables with validation and sensible defaults.
 
 Usage:
     from config import config
-    
+
     # Access configuration values
     api_key = config.OPENRAG_API_KEY
     url = config.OPENRAG_URL
-    
+
     # Validate configuration (optional, done automatically on import)
     config.validate()
 """
 import os
+from dataclasses import dataclass
 from pathlib import Path
 from typing import Optional
 
 from dotenv import load_dotenv
 
+# Resolve the .env path (project root, parent of the python directory) once at
+# import so every consumer shares the same cached constant.
+_ENV_PATH = Path(__file__).resolve().parent.parent / '.env'
+
+# Guard so re-importing this module (pytest, importlib.reload) doesn't re-stat
+# and re-parse the .env file.
+_LOADED = False
+
+
+def _load_env(override: bool = False) -> None:
+    """Load the .env file once, skipping redundant stat/parse on re-import."""
+    global _LOADED
+    if _LOADED and not override:
+        return
+    if _ENV_PATH.exists():
+        load_dotenv(_ENV_PATH, override=override)
+    else:
+        # Fallback: try loading from current directory
+        load_dotenv(override=override)
+    _LOADED = True
+
 
+def _env_snapshot() -> dict:
+    """Read all configuration values from the environment in one pass."""
+    return {
+        'OPENRAG_URL': os.getenv('OPENRAG_URL', 'http://localhost:3000'),
+        'OPENRAG_API_KEY': os.getenv('OPENRAG_API_KEY'),
+        'EVERART_API_KEY': os.getenv('EVERART_API_KEY'),
+        'ASTRA_DB_ENDPOINT': os.getenv('ASTRA_DB_ENDPOINT'),
+        'ASTRA_DB_APPLICATION_TOKEN': os.getenv('ASTRA_DB_APPLICATION_TOKEN'),
+    }
+
+
+@dataclass(frozen=True, slots=True, repr=False)
 class Config:
     """
     Application configuration loaded from environment variables.
-    
+
     This class centralizes all configuration management, providing:
     - Automatic .env file loading from project root
     - Type-safe access to configuration values
     - Validation of required settings
     - Sensible defaults for optional settings
+
+    The frozen, slotted dataclass makes every read a plain slot lookup and
+    guards against accidental mutation; reload() is the one sanctioned way
+    to refresh values after the environment changes.
     """
-    
-    def __init__(self):
-        """Initialize configuration by loading environment variables."""
-        # Load .env from project root (parent of python directory)
-        env_path = Path(__file__).parent.parent / '.env'
-        if env_path.exists():
-            load_dotenv(env_path)
-        else:
-            # Fallback: try loading from current directory
-            load_dotenv()
-    
+
     # OpenRAG Configuration
-    @property
-    def OPENRAG_URL(self) -> str:
-        """OpenRAG API base URL. Defaults to localhost:3000."""
-        return os.getenv('OPENRAG_URL', 'http://localhost:3000')
-    
-    @property
-    def OPENRAG_API_KEY(self) -> Optional[str]:
-        """OpenRAG API key. Required for API access."""
-        return os.getenv('OPENRAG_API_KEY')
-    
+    OPENRAG_URL: str
+    OPENRAG_API_KEY: Optional[str]
     # EverArt Configuration
-    @property
-    def EVERART_API_KEY(self) -> Optional[str]:
-        """EverArt API key for image generation (optional)."""
-        return os.getenv('EVERART_API_KEY')
-    
+    EVERART_API_KEY: Optional[str]
     # Astra DB Configuration
-    @property
-    def ASTRA_DB_ENDPOINT(self) -> Optional[str]:
-        """Astra DB endpoint URL (optional)."""
-        return os.getenv('ASTRA_DB_ENDPOINT')
-    
-    @property
-    def ASTRA_DB_APPLICATION_TOKEN(self) -> Optional[str]:
-        """Astra DB application token (optional)."""
-        return os.getenv('ASTRA_DB_APPLICATION_TOKEN')
-    
+    ASTRA_DB_ENDPOINT: Optional[str]
+    ASTRA_DB_APPLICATION_TOKEN: Optional[str]
+
+    def reload(self) -> None:
+        """
+        Re-read the .env file and environment, refreshing cached values.
+
+        Useful in tests, or after the environment changes at runtime
+        (e.g. when an API key is auto-generated and saved to .env).
+        Updates this instance in place so existing imports stay valid.
+        """
+        _load_env(override=True)
+        for name, value in _env_snapshot().items():
+            object.__setattr__(self, name, value)
+
     def validate(self, require_api_key: bool = False) -> None:
         """
         Validate that required configuration is present.
-        
+
         Args:
             require_api_key: If True, raises error if OPENRAG_API_KEY is not set.
                            If False, allows missing API key (will be created on first use).
-        
+
         Raises:
             ValueError: If required configuration is missing or invalid.
         """
         if not self.OPENRAG_URL:
             raise ValueError("OPENRAG_URL must be set in environment or .env file")
-        
+
         if require_api_key and not self.OPENRAG_API_KEY:
             raise ValueError(
                 "OPENRAG_API_KEY must be set in environment or .env file. "
                 "Run the application once to auto-generate an API key."
             )
-    
+
     def get_env_path(self) -> Path:
         """
         Get the path to the .env file.
-        
+
         Returns:
             Path: Path to the .env file in the project root.
         """
-        return Path(__file__).parent.parent / '.env'
-    
+        return _ENV_PATH
+
     def __repr__(self) -> str:
         """Return a string representation of the configuration (hiding sensitive values)."""
         return (
@@ -112,11 +133,17 @@ class Config:
         )
 
 
+def _build_config() -> Config:
+    """Construct a Config snapshot from the current environment."""
+    _load_env()
+    return Config(**_env_snapshot())
+
+
 # Create singleton instance
-config = Config()
+config = _build_config()
 
 # Validate on import (but don't require API key - it can be auto-generated)
 config.validate(require_api_key=False)
 
 
-# Made with Bob
\ No newline at end of file
+# Made with Bob
@@ -4,56 +4,64 @@ OpenRAG SDK Utility Modules
 This package provides simple, testable utility functions for each OpenRAG SDK endpoint.
 Each module can be run independently to test specific functionality.
 
+Submodules are imported lazily (PEP 562) so that importing a single function
+only pays for the one module it lives in, instead of pulling in the SDK,
+httpx, and dotenv for every consumer at import time.
+
 NOTE: Knowledge filter functions include both SDK-based (currently broken in SDK 0.1.0)
 and direct HTTP workaround functions (with _direct suffix).
 """
 
-from .settings import get_settings, update_settings
-from .chat import chat_simple, chat_streaming, list_conversations, get_conversation, delete_conversation
-from .search import search_query
-from .documents import ingest_document, delete_document
-from .knowledge_filters import (
-    # SDK-based functions (broken in SDK 0.1.0)
-    # create_filter,  # DISABLED
-    search_filters,
-    get_filter,
-    # update_filter,  # DISABLED
-    # delete_filter,  # DISABLED
-    # Workaround functions (direct HTTP calls)
-    # create_filter_direct,  # DISABLED
-    search_filters_direct,
-    get_filter_direct,
-    # update_filter_direct,  # DISABLED
-    # delete_filter_direct,  # DISABLED
-)
-
-__all__ = [
+import importlib
+
+# Maps exported name -> submodule it is defined in
+_EXPORTS = {
     # Settings
-    "get_settings",
-    "update_settings",
+    "get_settings": "settings",
+    "update_settings": "settings",
     # Chat
-    "chat_simple",
-    "chat_streaming",
-    "list_conversations",
-    "get_conversation",
-    "delete_conversation",
+    "chat_simple": "chat",
+    "chat_streaming": "chat",
+    "list_conversations": "chat",
+    "get_conversation": "chat",
+    "delete_conversation": "chat",
     # Search
-    "search_query",
+    "search_query": "search",
     # Documents
-    "ingest_document",
-    "delete_document",
+    "ingest_document": "documents",
+    "ingest_document_streaming": "documents",
+    "delete_document": "documents",
     # Knowledge Filters (SDK-based - broken in SDK 0.1.0)
-    # "create_filter",  # DISABLED
-    "search_filters",
-    "get_filter",
-    # "update_filter",  # DISABLED
-    # "delete_filter",  # DISABLED
+    # "create_filter": "knowledge_filters",  # DISABLED
+    "search_filters": "knowledge_filters",
+    "get_filter": "knowledge_filters",
+    # "update_filter": "knowledge_filters",  # DISABLED
+    # "delete_filter": "knowledge_filters",  # DISABLED
     # Knowledge Filters (Direct HTTP workarounds)
-    # "create_filter_direct",  # DISABLED
-    "search_filters_direct",
-    "get_filter_direct",
-    # "update_filter_direct",  # DISABLED
-    # "delete_filter_direct",  # DISABLED
-]
+    # "create_filter_direct": "knowledge_filters",  # DISABLED
+    "search_filters_direct": "knowledge_filters",
+    "iter_filters": "knowledge_filters",
+    "get_filter_direct": "knowledge_filters",
+    "bulk_get_filters_direct": "knowledge_filters",
+    # "update_filter_direct": "knowledge_filters",  # DISABLED
+    # "delete_filter_direct": "knowledge_filters",  # DISABLED
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name: str):
+    """Resolve exported names by importing their submodule on first access."""
+    submodule = _EXPORTS.get(name)
+    if submodule is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f".{submodule}", __name__), name)
+    # Cache on the package so subsequent lookups skip __getattr__
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
 
 # Made with Bob
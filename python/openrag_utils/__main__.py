@@ -0,0 +1,40 @@
+"""
+Run every utility module's endpoint test on a single event loop.
+
+`python -m openrag_utils` starts one loop and one shared client for all the
+module tests, instead of paying a loop startup and a fresh connection pool
+per script when they are run individually.
+"""
+import asyncio
+
+from ._client import aclose_default_client, get_default_client
+from ._loop import install_uvloop
+from .chat import main as chat_main
+from .documents import main as documents_main
+from .knowledge_filters import aclose_http_client
+from .knowledge_filters import main as knowledge_filters_main
+from .search import main as search_main
+from .settings import main as settings_main
+
+
+async def run_all() -> None:
+    """Run each module's endpoint test over one shared client."""
+    client = get_default_client()
+    try:
+        await settings_main(client)
+        await documents_main(client)
+        await search_main(client)
+        # knowledge_filters exercises the direct HTTP workarounds, which
+        # share their own pooled httpx client rather than the SDK client
+        await knowledge_filters_main()
+        await chat_main(client)
+    finally:
+        await aclose_http_client()
+        await aclose_default_client()
+
+
+if __name__ == '__main__':
+    install_uvloop()
+    asyncio.run(run_all())
+
+# Made with Bob
@@ -0,0 +1,47 @@
+"""
+Shared OpenRAG client management for the utility modules.
+
+Helper functions in this package accept an optional OpenRAGClient. When a
+caller doesn't pass one, they fall back to a lazily created default client
+from this module instead of opening (and tearing down) a fresh client per
+call, so one connection pool's keep-alive sockets are reused across calls.
+"""
+import asyncio
+from contextlib import asynccontextmanager
+from typing import Optional
+
+from openrag_sdk import OpenRAGClient
+
+# Default clients, created lazily and keyed by event loop so each loop reuses
+# one client (and its keep-alive connection pool) across calls.
+_default_clients: dict[asyncio.AbstractEventLoop, OpenRAGClient] = {}
+
+
+def get_default_client() -> OpenRAGClient:
+    """Get (or lazily create) the shared client for the running event loop."""
+    loop = asyncio.get_running_loop()
+    client = _default_clients.get(loop)
+    if client is None:
+        client = OpenRAGClient()
+        _default_clients[loop] = client
+    return client
+
+
+@asynccontextmanager
+async def client_ctx(client: Optional[OpenRAGClient]):
+    """
+    Yield the explicit client if given, otherwise the shared default.
+
+    Keeps the helper functions single-path: no per-call branch between
+    "caller-provided client" and "open a throwaway client" code paths.
+    """
+    yield client if client is not None else get_default_client()
+
+
+async def aclose_default_client() -> None:
+    """Close the shared client for the running event loop, if one exists."""
+    client = _default_clients.pop(asyncio.get_running_loop(), None)
+    if client is not None:
+        await client.close()
+
+# Made with Bob
@@ -11,6 +11,8 @@ from openrag_sdk import OpenRAGClient
 
 from config import config
 
+from ._client import client_ctx as _client_ctx
+
 
 async def chat_simple(message: str, chat_id: Optional[str] = None, client: Optional[OpenRAGClient] = None) -> dict:
     """
@@ -24,16 +26,8 @@ async def chat_simple(message: str, chat_id: Optional[str] = None, client: Optio
     Returns:
         dict: Response with 'response', 'chat_id', and 'sources'
     """
-    if client:
-        response = await client.chat.create(message=message, chat_id=chat_id)
-        return {
-            "response": response.response,
-            "chat_id": response.chat_id,
-            "sources": response.sources
-        }
-
-    async with OpenRAGClient() as client:
-        response = await client.chat.create(message=message, chat_id=chat_id)
+    async with _client_ctx(client) as c:
+        response = await c.chat.create(message=message, chat_id=chat_id)
         return {
             "response": response.response,
             "chat_id": response.chat_id,
@@ -53,8 +47,8 @@ async def chat_streaming(message: str, chat_id: Optional[str] = None, client: Op
     Yields:
         Event objects with type, delta, sources, chat_id, etc.
     """
-    if client:
-        async with client.chat.stream(message=message, chat_id=chat_id) as stream:
+    async with _client_ctx(client) as c:
+        async with c.chat.stream(message=message, chat_id=chat_id) as stream:
             async for event in stream:
                 yield event
             # Return final data
@@ -64,18 +58,6 @@ async def chat_streaming(message: str, chat_id: Optional[str] = None, client: Op
                 "chat_id": stream.chat_id,
                 "sources": stream.sources
             }
-    else:
-        async with OpenRAGClient() as client:
-            async with client.chat.stream(message=message, chat_id=chat_id) as stream:
-                async for event in stream:
-                    yield event
-                # Return final data
-                yield {
-                    "type": "final",
-                    "text": stream.text,
-                    "chat_id": stream.chat_id,
-                    "sources": stream.sources
-                }
 
 
 async def list_conversations(client: Optional[OpenRAGClient] = None) -> list:
@@ -88,12 +70,8 @@ async def list_conversations(client: Optional[OpenRAGClient] = None) -> list:
     Returns:
         list: List of conversation dictionaries
     """
-    if client:
-        result = await client.chat.list()
-        return result.conversations
-
-    async with OpenRAGClient() as client:
-        result = await client.chat.list()
+    async with _client_ctx(client) as c:
+        result = await c.chat.list()
         return result.conversations
 
 
@@ -108,16 +86,8 @@ async def get_conversation(chat_id: str, client: Optional[OpenRAGClient] = None)
     Returns:
         dict: Conversation data with messages
     """
-    if client:
-        conversation = await client.chat.get(chat_id)
-        return {
-            "chat_id": conversation.chat_id,
-            "title": conversation.title,
-            "messages": conversation.messages
-        }
-
-    async with OpenRAGClient() as client:
-        conversation = await client.chat.get(chat_id)
+    async with _client_ctx(client) as c:
+        conversation = await c.chat.get(chat_id)
         return {
             "chat_id": conversation.chat_id,
             "title": conversation.title,
@@ -136,26 +106,24 @@ async def delete_conversation(chat_id: str, client: Optional[OpenRAGClient] = No
     Returns:
         bool: True if successful
     """
-    if client:
-        await client.chat.delete(chat_id)
-        return True
-
-    async with OpenRAGClient() as client:
-        await client.chat.delete(chat_id)
+    async with _client_ctx(client) as c:
+        await c.chat.delete(chat_id)
         return True
 
 
-async def main():
+async def main(client: Optional[OpenRAGClient] = None):
     """Test chat endpoints"""
+    # Read config once into locals; format the masked key preview a single time
     api_key = config.OPENRAG_API_KEY
     url = config.OPENRAG_URL
+    key_preview = f"{api_key[:20]}..." if api_key else "NOT SET..."
 
-    print(f'Using API Key: {api_key[:20] if api_key else "NOT SET"}...')
+    print(f'Using API Key: {key_preview}')
     print(f'Using URL: {url}\n')
 
     # Simple chat
     print('=== Simple Chat ===')
-    response = await chat_simple("Hello! What is RAG?")
+    response = await chat_simple("Hello! What is RAG?", client=client)
     print(f"Response: {response['response'][:200]}...")
     print(f"Chat ID: {response['chat_id']}")
     print(f"Sources: {len(response['sources'])}")
@@ -164,19 +132,22 @@ async def main():
     # Streaming chat
     print('=== Streaming Chat ===')
     print("Response: ", end="", flush=True)
-    async for event in chat_streaming("Explain it briefly"):
-        event_type = getattr(event, 'type', event.get('type') if isinstance(event, dict) else None)
+    async for event in chat_streaming("Explain it briefly", client=client):
+        # Events are SDK objects except the synthetic dict final event;
+        # dispatch on the exact type once per event
+        is_dict = type(event) is dict
+        event_type = event.get('type') if is_dict else getattr(event, 'type', None)
         if event_type == "content":
-            delta = getattr(event, 'delta', event.get('delta') if isinstance(event, dict) else '')
+            delta = event.get('delta') if is_dict else getattr(event, 'delta', None)
             print(delta, end="", flush=True)
         elif event_type == "done":
-            chat_id = getattr(event, 'chat_id', event.get('chat_id') if isinstance(event, dict) else None)
+            chat_id = event.get('chat_id') if is_dict else getattr(event, 'chat_id', None)
             print(f"\nChat ID: {chat_id}")
     print()
 
     # List conversations
     print('=== List Conversations ===')
-    conversations = await list_conversations()
+    conversations = await list_conversations(client=client)
     print(f"Total conversations: {len(conversations)}")
     for conv in conversations[:3]:
         print(f"  - {conv.chat_id}: {conv.title}")
@@ -184,6 +155,19 @@ async def main():
 
 
 if __name__ == '__main__':
-    asyncio.run(main())
+    from ._client import aclose_default_client
+    from ._loop import install_uvloop
+
+    install_uvloop()
+
+    async def _standalone():
+        # Close the shared default client before the loop shuts down, like
+        # the baseline's async-with did for its per-run client
+        try:
+            await main()
+        finally:
+            await aclose_default_client()
+
+    asyncio.run(_standalone())
 
 # Made with Bob
@@ -12,34 +12,36 @@ from openrag_sdk import OpenRAGClient
 
 from config import config
 
+from ._client import client_ctx as _client_ctx
+
 
 async def ingest_document(
-    file_path: str,
+    file_path: str | list[str],
     wait: bool = True,
     client: Optional[OpenRAGClient] = None
 ) -> dict:
     """
-    Ingest a document into the knowledge base.
+    Ingest one or more documents into the knowledge base.
+
+    A single path behaves as before. When a list of paths is supplied, the
+    uploads run concurrently (capped at 10 in flight) over the shared client
+    and the per-file results are aggregated into one dict.
 
     Args:
-        file_path: Path to the file to ingest
+        file_path: Path to the file to ingest, or a list of paths
         wait: Whether to wait for ingestion to complete (default: True)
         client: Optional OpenRAGClient instance
 
     Returns:
-        dict: Ingestion result with status, task_id, successful_files, failed_files
+        dict: Ingestion result with status, task_id, successful_files,
+              failed_files. For a batch, task_id is a list of task IDs and
+              the file counts are summed across files.
     """
-    if client:
-        result = await client.documents.ingest(file_path=file_path, wait=wait)
-        return {
-            "status": result.status,
-            "task_id": result.task_id,
-            "successful_files": result.successful_files,  # type: ignore
-            "failed_files": result.failed_files  # type: ignore
-        }
+    async with _client_ctx(client) as c:
+        if isinstance(file_path, list):
+            return await _ingest_batch(file_path, wait, c)
 
-    async with OpenRAGClient() as client:
-        result = await client.documents.ingest(file_path=file_path, wait=wait)
+        result = await c.documents.ingest(file_path=file_path, wait=wait)
         return {
             "status": result.status,
             "task_id": result.task_id,
@@ -48,6 +50,61 @@ async def ingest_document(
         }
 
 
+async def _ingest_batch(file_paths: list[str], wait: bool, client: OpenRAGClient) -> dict:
+    """Ingest several files concurrently and aggregate the results."""
+    semaphore = asyncio.Semaphore(10)
+
+    async def ingest_one(path: str) -> dict:
+        async with semaphore:
+            return await ingest_document(path, wait=wait, client=client)
+
+    results = await asyncio.gather(*(ingest_one(path) for path in file_paths))
+    return {
+        "status": (
+            "completed"
+            if all(r["status"] == "completed" for r in results)
+            else "partial"
+        ),
+        "task_id": [r["task_id"] for r in results],
+        "successful_files": sum(r["successful_files"] for r in results),
+        "failed_files": sum(r["failed_files"] for r in results),
+    }
+
+
+async def ingest_document_streaming(
+    file_path: str,
+    wait: bool = True,
+    client: Optional[OpenRAGClient] = None
+) -> dict:
+    """
+    Ingest a large document without buffering it fully in memory.
+
+    Passing an open binary file handle to the SDK lets httpx stream the
+    multipart body chunk by chunk, so peak memory stays at one chunk
+    instead of the whole file. Prefer this over ingest_document for
+    multi-hundred-MB uploads.
+
+    Args:
+        file_path: Path to the file to ingest
+        wait: Whether to wait for ingestion to complete (default: True)
+        client: Optional OpenRAGClient instance
+
+    Returns:
+        dict: Ingestion result with status, task_id, successful_files,
+              failed_files
+    """
+    path = Path(file_path)
+    async with _client_ctx(client) as c:
+        with path.open("rb") as f:
+            result = await c.documents.ingest(file=f, filename=path.name, wait=wait)
+    return {
+        "status": result.status,
+        "task_id": result.task_id,
+        "successful_files": result.successful_files,  # type: ignore
+        "failed_files": result.failed_files  # type: ignore
+    }
+
+
 async def delete_document(
     filename: str,
     client: Optional[OpenRAGClient] = None
@@ -62,16 +119,12 @@ async def delete_document(
     Returns:
         bool: True if successful
     """
-    if client:
-        result = await client.documents.delete(filename)
-        return result.success
-
-    async with OpenRAGClient() as client:
-        result = await client.documents.delete(filename)
+    async with _client_ctx(client) as c:
+        result = await c.documents.delete(filename)
         return result.success
 
 
-async def main():
+async def main(client: Optional[OpenRAGClient] = None):
     """Test document endpoints"""
     api_key = config.OPENRAG_API_KEY
     url = config.OPENRAG_URL
@@ -79,15 +132,18 @@ async def main():
     print(f'Using API Key: {api_key[:20] if api_key else "NOT SET"}...')
     print(f'Using URL: {url}\n')
 
-    # Create a test file
+    # Create a test file (off the event loop; sync FS calls would block it)
     test_file = Path("test_document.md")
-    test_file.write_text("# Test Document\n\nThis is a test document for OpenRAG ingestion.")
+    await asyncio.to_thread(
+        test_file.write_text,
+        "# Test Document\n\nThis is a test document for OpenRAG ingestion.",
+    )
 
     try:
         # Ingest document
         print('=== Ingest Document ===')
         print(f"Ingesting: {test_file}")
-        result = await ingest_document(str(test_file), wait=True)
+        result = await ingest_document(str(test_file), wait=True, client=client)
         print(f"Status: {result['status']}")
         print(f"Task ID: {result['task_id']}")
         print(f"Successful: {result['successful_files']}")
@@ -97,7 +153,7 @@ async def main():
         # Delete document
         print('=== Delete Document ===')
         print(f"Deleting: {test_file.name}")
-        success = await delete_document(test_file.name)
+        success = await delete_document(test_file.name, client=client)
         print(f"Success: {success}")
         print()
 
@@ -106,11 +162,24 @@ async def main():
     finally:
         # Clean up test file
         if test_file.exists():
-            test_file.unlink()
+            await asyncio.to_thread(test_file.unlink)
             print(f"Cleaned up test file: {test_file}")
 
 
 if __name__ == '__main__':
-    asyncio.run(main())
+    from ._client import aclose_default_client
+    from ._loop import install_uvloop
+
+    install_uvloop()
+
+    async def _standalone():
+        # Close the shared default client before the loop shuts down, like
+        # the baseline's async-with did for its per-run client
+        try:
+            await main()
+        finally:
+            await aclose_default_client()
+
+    asyncio.run(_standalone())
 
 # Made with Bob
@@ -12,6 +12,8 @@ from openrag_sdk.models import SearchResponse
 
 from config import config
 
+from ._client import client_ctx as _client_ctx
+
 
 async def search_query(
     query: str,
@@ -33,16 +35,8 @@ async def search_query(
     Returns:
         SearchResponse: Search response with results list
     """
-    if client:
-        return await client.search.query(
-            query,
-            limit=limit,
-            score_threshold=score_threshold,
-            filter_id=filter_id
-        )
-
-    async with OpenRAGClient() as client:
-        return await client.search.query(
+    async with _client_ctx(client) as c:
+        return await c.search.query(
             query,
             limit=limit,
             score_threshold=score_threshold,
@@ -50,7 +44,7 @@ async def search_query(
         )
 
 
-async def main():
+async def main(client: Optional[OpenRAGClient] = None):
     """Test search endpoints"""
     api_key = config.OPENRAG_API_KEY
     url = config.OPENRAG_URL
@@ -64,7 +58,7 @@ async def main():
     print(f"Query: {query}")
 
     try:
-        response = await search_query(query, limit=5, score_threshold=0.3)
+        response = await search_query(query, limit=5, score_threshold=0.3, client=client)
         print(f"Found {len(response.results)} results:\n")
 
         for i, result in enumerate(response.results, 1):
@@ -77,6 +71,19 @@ async def main():
 
 
 if __name__ == '__main__':
-    asyncio.run(main())
+    from ._client import aclose_default_client
+    from ._loop import install_uvloop
+
+    install_uvloop()
+
+    async def _standalone():
+        # Close the shared default client before the loop shuts down, like
+        # the baseline's async-with did for its per-run client
+        try:
+            await main()
+        finally:
+            await aclose_default_client()
+
+    asyncio.run(_standalone())
 
 # Made with Bob
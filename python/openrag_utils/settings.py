@@ -5,37 +5,73 @@ Functions for getting and updating OpenRAG settings.
 Can be run as a standalone script to test settings endpoints.
 """
 import asyncio
+import copy
 import json
+import time
 from typing import Optional
 
 from openrag_sdk import OpenRAGClient
 
 from config import config
 
+from ._client import client_ctx as _client_ctx
+
+# Settings change rarely; cache the last fetch for a short TTL so a
+# read-modify-write cycle (and repeated reads) skip the GET round-trip.
+# The cache keeps a pristine copy: every return is a deep copy, so a
+# caller editing the dict (fetch -> tweak -> push) can't poison what the
+# next get_settings hands out.
+# The lock serializes concurrent fetches/updates so only one request is
+# in flight per cache miss.
+_SETTINGS_CACHE_TTL = 5.0
+_settings_cache: Optional[tuple[float, dict]] = None
+_settings_lock = asyncio.Lock()
+
+
+def invalidate_settings() -> None:
+    """Drop the cached settings, forcing the next get_settings to refetch."""
+    global _settings_cache
+    _settings_cache = None
+
 
 async def get_settings(client: Optional[OpenRAGClient] = None) -> dict:
     """
     Get current OpenRAG settings.
 
+    Results are cached in-process for a few seconds; call
+    invalidate_settings() to force a fresh fetch.
+
     Args:
         client: Optional OpenRAGClient instance. If not provided, creates a new one.
 
     Returns:
         dict: Settings dictionary with agent and knowledge configuration
     """
-    if client:
-        settings = await client.settings.get()
-        return settings.model_dump()
+    global _settings_cache
+
+    cached = _settings_cache
+    if cached is not None and time.monotonic() - cached[0] < _SETTINGS_CACHE_TTL:
+        return copy.deepcopy(cached[1])
 
-    async with OpenRAGClient() as client:
-        settings = await client.settings.get()
-        return settings.model_dump()
+    async with _client_ctx(client) as c, _settings_lock:
+        # Another coroutine may have refreshed the cache while we waited
+        cached = _settings_cache
+        if cached is not None and time.monotonic() - cached[0] < _SETTINGS_CACHE_TTL:
+            return copy.deepcopy(cached[1])
+
+        settings = await c.settings.get()
+        result = settings.model_dump()
+        _settings_cache = (time.monotonic(), result)
+        return copy.deepcopy(result)
 
 
 async def update_settings(updates: dict, client: Optional[OpenRAGClient] = None) -> dict:
     """
     Update OpenRAG settings.
 
+    The response replaces the cached settings, so a follow-up
+    get_settings doesn't round-trip again.
+
     Args:
         updates: Dictionary of settings to update (e.g., {"chunk_size": 1000})
         client: Optional OpenRAGClient instance. If not provided, creates a new one.
@@ -43,16 +79,16 @@ async def update_settings(updates: dict, client: Optional[OpenRAGClient] = None)
     Returns:
         dict: Updated settings
     """
-    if client:
-        result = await client.settings.update(updates)
-        return result.model_dump()  # type: ignore
+    global _settings_cache
 
-    async with OpenRAGClient() as client:
-        result = await client.settings.update(updates)
-        return result.model_dump()  # type: ignore
+    async with _client_ctx(client) as c, _settings_lock:
+        result = await c.settings.update(updates)
+        data = result.model_dump()  # type: ignore
+        _settings_cache = (time.monotonic(), data)
+        return copy.deepcopy(data)
 
 
-async def main():
+async def main(client: Optional[OpenRAGClient] = None):
     """Test settings endpoints"""
     api_key = config.OPENRAG_API_KEY
     url = config.OPENRAG_URL
@@ -62,7 +98,7 @@ async def main():
 
     # Get current settings
     print('=== Current Settings ===')
-    settings = await get_settings()
+    settings = await get_settings(client=client)
     print(json.dumps(settings, indent=2))
     print()
 
@@ -73,6 +109,19 @@ async def main():
 
 
 if __name__ == '__main__':
-    asyncio.run(main())
+    from ._client import aclose_default_client
+    from ._loop import install_uvloop
+
+    install_uvloop()
+
+    async def _standalone():
+        # Close the shared default client before the loop shuts down, like
+        # the baseline's async-with did for its per-run client
+        try:
+            await main()
+        finally:
+            await aclose_default_client()
+
+    asyncio.run(_standalone())
 
 # Made with Bob
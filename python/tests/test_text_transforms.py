@@ -0,0 +1,147 @@
+"""
+Unit tests for the pure chat-text transforms in utils.py.
+
+These functions are plain str -> str and need no server: they cover the
+hand-rolled link scanner, the JSON-decoder-based field highlighter, and
+the fused render_chat_text pass, including the malformed and partially
+streamed inputs the scanners are expected to leave alone.
+
+Run with: pytest tests/test_text_transforms.py -v
+"""
+
+import sys
+from pathlib import Path
+
+# Add parent directory to path to import utils
+sys.path.insert(0, str(Path(__file__).parent.parent))
+from utils import highlight_search_fields, make_links_clickable, render_chat_text
+
+
+class TestMakeLinksClickable:
+    def test_plain_prose_unchanged(self):
+        text = "no links here, just prose."
+        assert make_links_clickable(text) == text
+
+    def test_single_link(self):
+        assert (
+            make_links_clickable("see [docs](http://example.com) here")
+            == "see [link=http://example.com]docs[/link] here"
+        )
+
+    def test_multiple_links(self):
+        assert (
+            make_links_clickable("[a](1) mid [b](2)")
+            == "[link=1]a[/link] mid [link=2]b[/link]"
+        )
+
+    def test_link_at_start_and_end(self):
+        assert make_links_clickable("[x](u)") == "[link=u]x[/link]"
+        assert make_links_clickable("tail [x](u)") == "tail [link=u]x[/link]"
+
+    def test_unclosed_paren_left_alone(self):
+        text = "broken [link](no close"
+        assert make_links_clickable(text) == text
+
+    def test_stray_anchor_left_alone(self):
+        text = "text ]( stray anchor"
+        assert make_links_clickable(text) == text
+
+    def test_empty_text_left_alone(self):
+        text = "empty [](url) link"
+        assert make_links_clickable(text) == text
+
+    def test_empty_url_left_alone(self):
+        text = "empty [text]() link"
+        assert make_links_clickable(text) == text
+
+    def test_bracket_inside_text_rejected(self):
+        # The old regex's [^\]]+ never matched across a ']'
+        text = "weird [a]b](u) shape"
+        assert make_links_clickable(text) == text
+
+    def test_greedy_url_matches_old_regex(self):
+        # Like the regex's [^\)]+, the url runs to the first ')' even
+        # when another link-looking shape sits inside it
+        assert (
+            make_links_clickable("[bad](open [good](url)")
+            == "[link=open [good](url]bad[/link]"
+        )
+
+
+class TestHighlightSearchFields:
+    def test_plain_prose_unchanged(self):
+        text = "nothing to highlight here."
+        assert highlight_search_fields(text) == text
+
+    def test_fences_query_object(self):
+        assert (
+            highlight_search_fields('before {"query": "cats"} after')
+            == 'before ```json\n{"query": "cats"}\n```\n\n after'
+        )
+
+    def test_swallows_comma_separator(self):
+        assert (
+            highlight_search_fields('results, {"query": "x"} done')
+            == 'results```json\n{"query": "x"}\n```\n\n done'
+        )
+
+    def test_nested_object_fenced_whole(self):
+        text = '{"search_query": "a", "opts": {"limit": 5}} tail'
+        assert (
+            highlight_search_fields(text)
+            == '```json\n{"search_query": "a", "opts": {"limit": 5}}\n```\n\n tail'
+        )
+
+    def test_partial_stream_left_alone(self):
+        # Closing brace hasn't arrived yet - typical mid-stream chunk
+        text = 'so far {"query": "unfini'
+        assert highlight_search_fields(text) == text
+
+    def test_invalid_json_left_alone(self):
+        text = 'odd {"query": nope} shape'
+        assert highlight_search_fields(text) == text
+
+    def test_object_without_marker_keys_left_alone(self):
+        text = 'plain {"foo": "bar"} object'
+        assert highlight_search_fields(text) == text
+
+    def test_braces_inside_string_values(self):
+        # The decoder understands escapes and braces in strings, which the
+        # old [^}]* pattern never did
+        text = '{"input_value": "a \\" quote and a } brace"} end'
+        assert (
+            highlight_search_fields(text)
+            == '```json\n{"input_value": "a \\" quote and a } brace"}\n```\n\n end'
+        )
+
+    def test_multiple_objects(self):
+        out = highlight_search_fields('{"query": "a"} mid {"query": "b"}')
+        assert out == '```json\n{"query": "a"}\n```\n\n mid ```json\n{"query": "b"}\n```\n\n'
+
+
+class TestRenderChatText:
+    CASES = [
+        "plain prose, nothing at all",
+        "just a [link](http://x) here",
+        'just a {"query": "y"} block',
+        'both [docs](http://x) and {"query": "y"} present',
+        '{"search_query": "a"} then [a](1) then {"input_value": "b"} then [b](2)',
+        'broken [link( and partial {"query": "unfin',
+        'results, {"query": "x"} with [tail](u)',
+    ]
+
+    def test_matches_chained_transforms(self):
+        for text in self.CASES:
+            assert render_chat_text(text) == make_links_clickable(
+                highlight_search_fields(text)
+            ), text
+
+    def test_untouched_input_returned_as_is(self):
+        text = "no anchors of either kind"
+        assert render_chat_text(text) == text
+
+    def test_oversized_input_bypasses_cache(self):
+        text = "x" * (64 * 1024 + 1)
+        assert render_chat_text(text) == text
+
+# Made with Bob
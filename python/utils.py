@@ -4,14 +4,23 @@ Utility functions for the OpenRAG app.
 This module contains helper functions for UI rendering, formatting, and chat loop management.
 The main.py file focuses on the core OpenRAG SDK integration.
 """
-import re
+import asyncio
+import json
+import time
+from functools import lru_cache, wraps
+from typing import TYPE_CHECKING
 
-from openrag_sdk import OpenRAGClient
-from rich.console import Console
-from rich.live import Live
-from rich.markdown import Markdown
-from rich.panel import Panel
-from rich.spinner import Spinner
+from openrag_utils._loop import enable_eager_tasks, install_uvloop
+
+# rich and the SDK are imported inside the functions that use them, so
+# importing this module for the pure string helpers (or bailing early on a
+# config error) doesn't pay their startup cost.
+if TYPE_CHECKING:
+    from openrag_sdk import OpenRAGClient
+
+# Pick up uvloop for the chat REPL (and anything else importing this module
+# before starting its loop); best-effort no-op when uvloop isn't installed.
+install_uvloop()
 
 
 def render_streaming_response(accumulated_text: str):
@@ -27,13 +36,13 @@ def render_streaming_response(accumulated_text: str):
     Returns:
         Markdown: Rich Markdown object for rendering
     """
-    # Apply formatting and render as markdown
-    styled_text = highlight_search_fields(accumulated_text)
-    clickable_markdown = make_links_clickable(styled_text)
-    return Markdown(clickable_markdown)
+    from rich.markdown import Markdown
+
+    # Apply both text transforms in one fused pass and render as markdown
+    return Markdown(render_chat_text(accumulated_text))
 
 
-async def run_chat_session(client: OpenRAGClient, stream_func, render_func):
+async def run_chat_session(client: "OpenRAGClient", stream_func, render_func):
     """
     Run an interactive chat session with OpenRAG.
     
@@ -44,6 +53,16 @@ async def run_chat_session(client: OpenRAGClient, stream_func, render_func):
         stream_func: Async function to call for streaming responses (stream_response from main.py)
         render_func: Function to render the accumulated text (render_streaming_response)
     """
+    from rich.console import Console, Group
+    from rich.live import Live
+    from rich.markdown import Markdown
+    from rich.panel import Panel
+    from rich.spinner import Spinner
+
+    # Short-lived coroutines spawned per message complete without the
+    # ready-queue round-trip under the eager task factory (3.12+)
+    enable_eager_tasks()
+
     console = Console()
     chat_id = None
 
@@ -59,8 +78,11 @@ async def run_chat_session(client: OpenRAGClient, stream_func, render_func):
     # Main chat loop
     while True:
         try:
-            # Get user input
-            user_input = console.input("[bold cyan]You:[/bold cyan] ").strip()
+            # Get user input on a worker thread so the blocking read doesn't
+            # stall the event loop (and any in-flight SDK I/O)
+            user_input = (
+                await asyncio.to_thread(console.input, "[bold cyan]You:[/bold cyan] ")
+            ).strip()
             console.print()
 
             # Check for exit commands
@@ -72,23 +94,93 @@ async def run_chat_session(client: OpenRAGClient, stream_func, render_func):
             if not user_input:
                 continue
 
-            # Set up real-time streaming rendering
-            spinner = Spinner("dots", text="[dim]RAGging...[/dim]")
-
             # Use Live to render markdown as it streams
             with Live(Markdown(""), console=console, refresh_per_second=10) as live:
-                live.update(spinner)
+                # Defer the spinner: it only appears if no content has
+                # arrived within 150ms, so fast responses never pay for
+                # constructing and painting it at all
+                def show_spinner():
+                    live.update(Spinner("dots", text="[dim]RAGging...[/dim]"))
+
+                spinner_handle = asyncio.get_running_loop().call_later(0.15, show_spinner)
+
+                # Throttle markdown re-parses to the display's 10 Hz refresh
+                # cadence; parsing the full buffer on every token is quadratic.
+                # Renders are also skipped until enough new content arrives
+                # (64 chars or a line break) to visibly change the layout.
+                last_render = 0.0
+                last_render_len = 0
+                total_len = 0
+                dirty = False
+                has_visible = False  # non-whitespace arrived since last render
+
+                # Incremental rendering state: the stream callback only ships
+                # deltas, so the renderer owns the buffer. Blocks up to the
+                # last blank line are parsed once and frozen; only the
+                # still-forming tail is re-parsed on each render tick.
+                committed = []
+                tail_parts = []
+
+                # Small per-message cache: the boundary commit and the
+                # final render re-parse a tail string that was usually
+                # just rendered, so reuse the parsed result
+                render_cached = lru_cache(maxsize=8)(render_func)
 
-                # Callback function to update the live display as chunks arrive
-                def on_chunk(accumulated_text):
-                    rendered = render_func(accumulated_text)
-                    live.update(rendered)
+                def render_incremental():
+                    tail = "".join(tail_parts)
+                    boundary = tail.rfind("\n\n")
+                    if boundary != -1:
+                        block = tail[:boundary + 2]
+                        # Fenced code blocks often contain blank lines, so
+                        # the last "\n\n" may fall inside an open ``` fence;
+                        # freezing that split would render an unterminated
+                        # fence and flip all later text in and out of code.
+                        # Only commit while the block's fences are balanced -
+                        # otherwise keep growing the tail until they close.
+                        if block.count("```") % 2 == 0:
+                            committed.append(render_cached(block))
+                            tail = tail[boundary + 2:]
+                            tail_parts[:] = [tail]
+                    return Group(*committed, render_cached(tail))
+
+                # Callback invoked with each new delta as it arrives
+                def on_delta(delta):
+                    nonlocal last_render, last_render_len, total_len, dirty, has_visible
+                    spinner_handle.cancel()  # no-op after the first delta
+                    tail_parts.append(delta)
+                    total_len += len(delta)
+                    dirty = True
+                    if delta and not delta.isspace():
+                        has_visible = True
+                    # Whitespace-only progress (typical single-space tokens)
+                    # can't change what's on screen; wait for real content
+                    if not has_visible:
+                        return
+                    if total_len - last_render_len < 64 and '\n' not in delta:
+                        return
+                    now = time.monotonic()
+                    if now - last_render < 0.1:
+                        return
+                    last_render = now
+                    last_render_len = total_len
+                    has_visible = False
+                    live.update(render_incremental())
+                    dirty = False
 
                 # Stream the response using the OpenRAG SDK
-                chat_id, _ = await stream_func(
-                    client, user_input, chat_id, on_chunk
+                chat_id, full_text = await stream_func(
+                    client, user_input, chat_id, on_delta
                 )
 
+                # The stream is done; make sure a pending spinner never fires
+                spinner_handle.cancel()
+
+                # Final render parses the complete message in one piece, so
+                # the display never keeps an artifact of the incremental
+                # splits (and late chunks aren't lost to the throttle)
+                if full_text:
+                    live.update(render_func(full_text))
+
             console.print()  # Blank line for readability
 
         except KeyboardInterrupt:
@@ -103,33 +195,200 @@ async def run_chat_session(client: OpenRAGClient, stream_func, render_func):
             console.print("[dim]Please try again or type 'exit' to quit.[/dim]\n")
 
 
+# Quoted key fragments that mark a JSON object as a search payload
+_FIELD_KEYS = ('"input_value"', '"query"', '"search_')
+
+# Reused decoder: raw_decode consumes exactly one JSON value from an offset
+_JSON_DECODER = json.JSONDecoder()
+
+# Fence pieces around an emitted search object; a three-operand str add
+# with interned literal ends is one allocation per block, versus the
+# f-string's parse-and-join machinery
+_JSON_OPEN = '```json\n'
+_JSON_CLOSE = '\n```\n\n'
+
+# Inputs above this size bypass the result cache so a handful of huge
+# messages can't pin megabytes of near-duplicate strings in memory
+_CACHE_MAX_LEN = 64 * 1024
+
+
+def _cached_text_transform(impl):
+    """
+    Wrap a pure str -> str transform with an LRU result cache.
+
+    The transforms are deterministic and get re-run on the same message
+    body many times (re-renders, the final render after streaming), so a
+    hit returns the previous result without rescanning. Oversized inputs
+    skip the cache entirely.
+    """
+    cached = lru_cache(maxsize=1024)(impl)
+
+    @wraps(impl)
+    def wrapper(text: str) -> str:
+        if len(text) > _CACHE_MAX_LEN:
+            return impl(text)
+        return cached(text)
+
+    return wrapper
+
+
+@_cached_text_transform
 def make_links_clickable(markdown_text: str) -> str:
     """
     Convert markdown links [text](url) to Rich clickable link markup.
     This preserves all other markdown formatting while making links clickable.
+
+    Implemented with str.find/rfind around each '](' anchor instead of a
+    regex - every step is a C-level substring scan or slice, with no
+    regex state machine. Same scanner the fused render_chat_text pass
+    uses for its link branch.
     """
-    link_pattern = r'\[([^\]]+)\]\(([^\)]+)\)'
+    # Plain prose has no link anchor at all; bail on one substring scan
+    if '](' not in markdown_text:
+        return markdown_text
 
-    def replace_link(match):
-        text = match.group(1)
-        url = match.group(2)
-        return f'[link={url}]{text}[/link]'
+    out = []
+    flushed = 0  # everything before this offset is already in out
+    anchor = markdown_text.find('](')
+    while anchor != -1:
+        lb = markdown_text.rfind('[', flushed, anchor)
+        rp = markdown_text.find(')', anchor + 2)
+        link_text = markdown_text[lb + 1:anchor] if lb != -1 else ''
+        # Reject shapes the regex this replaced also skipped: missing
+        # brackets, empty text or url, ']' inside the text
+        if lb == -1 or rp == -1 or rp == anchor + 2 or not link_text or ']' in link_text:
+            anchor = markdown_text.find('](', anchor + 2)
+            continue
+        out.append(markdown_text[flushed:lb])
+        out.append(f'[link={markdown_text[anchor + 2:rp]}]{link_text}[/link]')
+        flushed = rp + 1
+        anchor = markdown_text.find('](', flushed)
 
-    return re.sub(link_pattern, replace_link, markdown_text)
+    if not out:
+        return markdown_text
+    out.append(markdown_text[flushed:])
+    return ''.join(out)
 
 
+@_cached_text_transform
+def render_chat_text(text: str) -> str:
+    """
+    Apply both chat-text transforms - fenced search-JSON blocks and
+    clickable links - in a single left-to-right pass.
+
+    Chaining highlight_search_fields and make_links_clickable walks the
+    buffer twice per render tick; this fused scan walks it once, handling
+    whichever anchor (JSON object or link) comes next. Text with only one
+    kind of anchor falls through to the cheaper single transform.
+    """
+    has_json = any(key in text for key in _FIELD_KEYS)
+    has_link = '](' in text
+    if not has_json:
+        return make_links_clickable(text) if has_link else text
+    if not has_link:
+        return highlight_search_fields(text)
+
+    out = []
+    flushed = 0  # everything before this offset is already in out
+    brace = text.find('{')
+    anchor = text.find('](')
+    while brace != -1 or anchor != -1:
+        if anchor == -1 or (brace != -1 and brace < anchor):
+            # Candidate JSON span
+            try:
+                _, end = _JSON_DECODER.raw_decode(text, brace)
+            except ValueError:
+                brace = text.find('{', brace + 1)
+                continue
+            span = text[brace:end]
+            if any(key in span for key in _FIELD_KEYS):
+                lead_end = brace
+                k = brace - 1
+                while k >= flushed and text[k] in ' \t\r\n':
+                    k -= 1
+                if k >= flushed and text[k] == ',':
+                    lead_end = k
+                out.append(text[flushed:lead_end])
+                out.append(_JSON_OPEN + span + _JSON_CLOSE)
+                flushed = end
+                if anchor != -1 and anchor < flushed:
+                    anchor = text.find('](', flushed)
+            brace = text.find('{', end)
+        else:
+            # Candidate markdown link around the '](' anchor
+            lb = text.rfind('[', flushed, anchor)
+            rp = text.find(')', anchor + 2)
+            link_text = text[lb + 1:anchor] if lb != -1 else ''
+            # Reject shapes the old regex skipped: missing brackets, empty
+            # text or url, ']' inside the text
+            if lb == -1 or rp == -1 or rp == anchor + 2 or not link_text or ']' in link_text:
+                anchor = text.find('](', anchor + 2)
+                continue
+            out.append(text[flushed:lb])
+            out.append(f'[link={text[anchor + 2:rp]}]{link_text}[/link]')
+            flushed = rp + 1
+            anchor = text.find('](', flushed)
+            if brace != -1 and brace < flushed:
+                brace = text.find('{', flushed)
+
+    if not out:
+        return text
+    out.append(text[flushed:])
+    return ''.join(out)
+
+
+@_cached_text_transform
 def highlight_search_fields(text: str) -> str:
     """
-    Find JSON fields like search_query, search_mode, etc. and wrap their values 
-    in Rich markup to make them stand out.
+    Find JSON objects carrying search fields (search_query, search_mode,
+    input_value, query, ...) and emit them as fenced json blocks so they
+    stand out.
+
+    Implemented as a single linear scan rather than a regex: each ``{`` is
+    handed to ``json.JSONDecoder.raw_decode``, which consumes exactly one
+    object in linear time with full awareness of nesting, escaped quotes,
+    and braces inside string literals - all shapes the old ``[^}]*``
+    pattern either missed or backtracked on. Spans that don't parse
+    (e.g. still streaming) are left untouched.
     """
-    field_pattern = r'(?:,\s*)?\{[^}]*"(input_value|search_query|search_mode|search_[^"]+|query)"[^}]*\}'
+    # Bail before scanning when the text can't possibly hold a complete
+    # search object: no closing brace (the usual case for still-streaming
+    # partials) or none of the marker keys at all (ordinary prose). Each
+    # check is a single C-level substring scan.
+    if '}' not in text:
+        return text
+    if not any(key in text for key in _FIELD_KEYS):
+        return text
+
+    out = []
+    flushed = 0  # everything before this offset is already in out
+    i = text.find('{')
+    while i != -1:
+        try:
+            _, end = _JSON_DECODER.raw_decode(text, i)
+        except ValueError:
+            # Not a complete JSON value from here; try the next brace
+            i = text.find('{', i + 1)
+            continue
 
-    def replace_field(match):
-        full_match = match.group(0)
-        json_obj = full_match.lstrip(', ')
-        return f'```json\n{json_obj}\n```\n\n'
+        span = text[i:end]
+        if any(key in span for key in _FIELD_KEYS):
+            # Swallow one ", "-style separator before the block, like the
+            # old pattern's optional prefix did
+            lead_end = i
+            k = i - 1
+            while k >= flushed and text[k] in ' \t\r\n':
+                k -= 1
+            if k >= flushed and text[k] == ',':
+                lead_end = k
+            out.append(text[flushed:lead_end])
+            out.append(_JSON_OPEN + span + _JSON_CLOSE)
+            flushed = end
+        i = text.find('{', end)
 
-    return re.sub(field_pattern, replace_field, text)
+    if not out:
+        return text
+    out.append(text[flushed:])
+    return ''.join(out)
 
 # Made with Bob